@@ -11,37 +11,43 @@ import logging.handlers
 # Determine log level based on environment
 log_level = logging.DEBUG if os.getenv('FLASK_ENV') != 'production' else logging.INFO
 
-# Configure root logger
+# Configure root logger, which also carries the INFO logs of assistant_core and
+# rag_assistant, so it must be set up before they are imported
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+
+# This module's own logger follows the environment level and logs through the root handlers
 logger = logging.getLogger(__name__)
 logger.setLevel(log_level)
 
 # Create formatter with more detailed information for production
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(process)d - %(thread)d - %(message)s')
 
-# Ensure logs directory exists
-os.makedirs('logs', exist_ok=True)
-
 # Only add handlers if they haven't been added already
-if not logger.handlers:
-    # File Handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        "logs/api.log", 
-        maxBytes=10485760,  # 10MB
-        backupCount=10
-    )
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+if not root_logger.handlers:
+    # File Handler with rotation, skipped if the logs directory isn't writable
+    try:
+        os.makedirs('logs', exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            "logs/api.log", 
+            maxBytes=10485760,  # 10MB
+            backupCount=10
+        )
+        file_handler.setFormatter(formatter)
+        root_logger.addHandler(file_handler)
+    except OSError as e:
+        print(f"File logging disabled: {e}")
     
     # Stream Handler (to console)
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    root_logger.addHandler(stream_handler)
 
 logger.info(f"Starting application in {os.getenv('FLASK_ENV', 'development')} mode")
 # --- End Logger Configuration ---
 
 from assistant_core import run_chat
-from vote_manager import record_vote, init_db, fetch_votes, get_vote_statistics
+from vote_manager import record_vote, init_db, init_logging, fetch_votes, get_vote_statistics
 
 
 app = Flask(__name__)
@@ -59,6 +65,9 @@ else:
     logger.info("Configuring CORS for development, allowing all origins")
     CORS(app)
 
+# Configure vote manager logging before its first use
+init_logging()
+
 # Initialize the database (use the logger we just configured)
 logger.info("Initializing database...") # This should now log correctly
 init_db() # Assuming init_db doesn't configure logging itself
@@ -122,25 +131,21 @@ def get_votes():
     vote_filter = request.args.get('vote')
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
+    include_evaluation = request.args.get('include_evaluation', 'false').lower() == 'true'
 
     if vote_filter and vote_filter not in ['yes', 'no']:
         logger.warning(f"Invalid vote filter: {vote_filter}")
         return jsonify({"error": "Vote filter must be 'yes' or 'no'"}), 400
 
-    # Validate date formats
-    for date_label, date_value in [('start_date', start_date), ('end_date', end_date)]:
-        if date_value:
-            try:
-                datetime.datetime.strptime(date_value, "%Y-%m-%d")
-            except Exception as e:
-                logger.warning(f"Invalid {date_label} format: {date_value} - {e}")
-                return jsonify({"error": f"{date_label} must be in YYYY-MM-DD format"}), 400
-
     try:
-        logger.info(f"Fetching votes with limit={limit}, offset={offset}, vote_filter={vote_filter}, start_date={start_date}, end_date={end_date}")
-        votes = fetch_votes(limit=limit, offset=offset, vote_filter=vote_filter, start_date=start_date, end_date=end_date)
+        logger.info(f"Fetching votes with limit={limit}, offset={offset}, vote_filter={vote_filter}, start_date={start_date}, end_date={end_date}, include_evaluation={include_evaluation}")
+        votes = fetch_votes(limit=limit, offset=offset, vote_filter=vote_filter, start_date=start_date, end_date=end_date, include_evaluation=include_evaluation)
         logger.info(f"Retrieved {len(votes)} votes")
         return jsonify({"votes": votes})
+    except ValueError as e:
+        # fetch_votes validates the date filters
+        logger.warning(f"Invalid date filter: {e}")
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching votes: {str(e)}")
         logger.error(traceback.format_exc())
@@ -7,7 +7,7 @@ import traceback
 import datetime
 import json
 from rag_assistant import AzureRAGAssistant
-from vote_manager import init_db, record_vote
+from vote_manager import init_db, init_logging, record_vote
 
 
 
@@ -183,7 +183,9 @@ Return ONLY the following JSON structure — no Markdown, no formatting:
         return {"error": str(e)}
 
 if __name__ == "__main__":
-    # Initialize database first
+    # Show this module's INFO logs, then configure vote manager logging and initialize the database
+    logging.getLogger().setLevel(logging.INFO)
+    init_logging()
     init_db()
 
     # Run the chat
@@ -1,49 +1,242 @@
 # vote_manager.py
 
-import psycopg2
+import psycopg
 import os
+import atexit
+import functools
+import json
 import logging
-from datetime import datetime
-from psycopg2.extras import DictCursor
-
-# Get the database URL from the environment variable set by Heroku
-DATABASE_URL = os.environ.get('DATABASE_URL')
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/vote_manager.log"),
-        logging.StreamHandler()
-    ]
-)
+import logging.handlers
+import queue
+import threading
+import time
+from datetime import date
+from psycopg.conninfo import conninfo_to_dict
+from psycopg.pq import TransactionStatus
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
+
+# Advisory lock key serializing init_db() across workers booting at once
+_INIT_DB_LOCK_KEY = 7242301
+
+# Seconds a pooled connection is reused before the pool replaces it
+CONN_MAX_AGE = float(os.environ.get("DB_CONN_MAX_AGE", 3600))
+
+# Number of executions of the same query on a connection before psycopg
+# prepares it server-side and reuses the plan
+PREPARE_THRESHOLD = 5
+
+# Longest a dashboard read query may run before the server cancels it
+STATEMENT_TIMEOUT = os.environ.get("DB_STATEMENT_TIMEOUT", "3s")
+
+# Per-transaction settings for reads: mark them read-only, cap their run time,
+# and plan each query for the actual filter values, since the generic plan of
+# the NULL-able fetch_votes filters can't use the indexes
+_READ_SETTINGS_SQL = """
+    SELECT set_config('transaction_read_only', 'on', true),
+           set_config('statement_timeout', %s, true),
+           set_config('plan_cache_mode', 'force_custom_plan', true)
+"""
+
+# Per-transaction settings for inserts, whose plan doesn't depend on the
+# values. Commits don't wait for the WAL flush: a crash can lose the last
+# few hundred milliseconds of votes, but never corrupts the table.
+_WRITE_SETTINGS_SQL = """
+    SELECT set_config('plan_cache_mode', 'force_generic_plan', true),
+           set_config('synchronous_commit', 'off', true)
+"""
+
+# Page size used by fetch_votes() when no limit is given, and the largest page
+# it returns; use iter_votes() to stream larger result sets
+DEFAULT_FETCH_LIMIT = 500
+MAX_FETCH_LIMIT = 5000
+
+# Seconds that get_vote_statistics() results are served from memory
+STATS_CACHE_TTL = float(os.environ.get("VOTE_STATS_CACHE_TTL", 10))
+
 logger = logging.getLogger(__name__)
 
-def get_db_connection():
-    """Establishes a connection to the PostgreSQL database."""
-    if not DATABASE_URL:
+def init_logging(level=logging.INFO):
+    """
+    Configure logging for the vote manager; call once from the application entrypoint.
+
+    Records are handed to a queue and written to the log file and console by a
+    background thread, so request threads never block on log I/O.
+    Does nothing if the logger already has handlers. Falls back to console-only
+    logging if the logs directory can't be created or written to.
+    """
+    if logger.handlers:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    try:
+        os.makedirs("logs", exist_ok=True)
+        handlers = [
+            logging.FileHandler("logs/vote_manager.log"),
+            logging.StreamHandler()
+        ]
+    except OSError:
+        # e.g. a read-only or ephemeral filesystem
+        handlers = [logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    # The listener already writes to the console; don't repeat records via the root logger
+    logger.propagate = False
+
+# Connection pools created on first use: one shared by all threads of the
+# worker, and one for async callers bound to the application's event loop
+_POOL = None
+_POOL_LOCK = threading.Lock()
+_ASYNC_POOL = None
+
+def _get_database_url():
+    """
+    Return the database URL to connect to, in the format psycopg expects.
+
+    Read from the environment when a pool is first created rather than at
+    import, so it only needs to be set before the first database call. The
+    pools are never rebuilt, so a worker keeps using that URL until it is
+    restarted. DATABASE_URL is set by Heroku, and an optional PgBouncer
+    endpoint (transaction pooling) in DATABASE_POOL_URL takes precedence over it.
+    """
+    db_url = os.environ.get('DATABASE_POOL_URL') or os.environ.get('DATABASE_URL')
+    if not db_url:
         logger.error("DATABASE_URL environment variable not set.")
         raise ValueError("Database connection URL not found.")
-    
+
     # Fix for Heroku PostgreSQL URL format
-    db_url = DATABASE_URL
     if db_url.startswith("postgres://"):
         logger.info("Converting postgres:// URL to postgresql:// format")
         db_url = db_url.replace("postgres://", "postgresql://", 1)
-    
+    return db_url
+
+def _get_connection_kwargs(db_url):
+    """Return the connection arguments shared by the sync and async pools."""
+    # Session-scoped server-side prepared statements don't survive PgBouncer's
+    # transaction pooling, so they are disabled when connecting through it
+    behind_pgbouncer = bool(os.environ.get('DATABASE_POOL_URL'))
+    kwargs = {
+        "prepare_threshold": None if behind_pgbouncer else PREPARE_THRESHOLD,
+        # Keep idle pooled connections alive through Heroku's idle-connection killer
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+    }
+    # Require SSL unless the URL (or PGSSLMODE) chooses, e.g. sslmode=disable
+    # for a local PgBouncer that only accepts plain TCP
+    if "sslmode" not in conninfo_to_dict(db_url) and not os.environ.get('PGSSLMODE'):
+        kwargs["sslmode"] = "require"
+    return kwargs
+
+def _get_pool():
+    """Return the module-level connection pool, creating it on first use."""
+    global _POOL
+    if _POOL is not None:
+        return _POOL
+
+    with _POOL_LOCK:
+        if _POOL is not None:
+            return _POOL
+
+        db_url = _get_database_url()
+
+        # Connect using the URL, requiring SSL unless it sets sslmode
+        logger.info(f"Creating connection pool with URL: {db_url[:25]}...") # Log only the beginning for security
+        pool = ConnectionPool(
+            conninfo=db_url,
+            min_size=1,
+            max_size=int(os.environ.get("DB_POOL_MAX", 10)),
+            kwargs=_get_connection_kwargs(db_url),
+            max_lifetime=CONN_MAX_AGE,
+            open=True
+        )
+        try:
+            # Fail fast, like a direct connect, if the database is unreachable
+            pool.wait()
+            logger.info("Successfully created PostgreSQL connection pool")
+            _POOL = pool
+            return _POOL
+        except (psycopg.OperationalError, PoolTimeout) as e:
+            pool.close()
+            logger.error(f"Error connecting to database: {e}")
+            # Print to stdout for Heroku logs
+            print(f"DATABASE CONNECTION ERROR: {str(e)}")
+            raise
+
+# Async read path for ASGI callers. Nothing in this repository opens the async
+# pool yet: the Flask app in api.py uses the synchronous functions only.
+async def open_async_pool():
+    """
+    Open the async connection pool used by the *_async read functions.
+
+    Call once from the startup hook of an ASGI application (e.g. FastAPI), as the
+    pool is bound to the running event loop. Flask runs each async view in its
+    own event loop, so its views keep using the synchronous functions.
+    """
+    global _ASYNC_POOL
+    if _ASYNC_POOL is not None:
+        return _ASYNC_POOL
+
+    db_url = _get_database_url()
+    logger.info(f"Creating async connection pool with URL: {db_url[:25]}...") # Log only the beginning for security
+    pool = AsyncConnectionPool(
+        conninfo=db_url,
+        min_size=1,
+        max_size=int(os.environ.get("DB_POOL_MAX", 10)),
+        kwargs=_get_connection_kwargs(db_url),
+        max_lifetime=CONN_MAX_AGE,
+        open=False
+    )
     try:
-        # Connect using the URL, requiring SSL
-        logger.info(f"Connecting to database with URL: {db_url[:25]}...") # Log only the beginning for security
-        conn = psycopg2.connect(db_url, sslmode='require')
-        logger.info("Successfully connected to PostgreSQL database")
-        return conn
-    except psycopg2.OperationalError as e:
+        await pool.open(wait=True)
+        logger.info("Successfully created async PostgreSQL connection pool")
+        _ASYNC_POOL = pool
+        return _ASYNC_POOL
+    except (psycopg.OperationalError, PoolTimeout) as e:
+        await pool.close()
         logger.error(f"Error connecting to database: {e}")
         # Print to stdout for Heroku logs
         print(f"DATABASE CONNECTION ERROR: {str(e)}")
         raise
 
+def _get_async_pool():
+    """Return the async connection pool, which must already be open."""
+    if _ASYNC_POOL is None:
+        raise RuntimeError("Async connection pool is not open; call open_async_pool() first.")
+    return _ASYNC_POOL
+
+async def close_async_pool():
+    """Close the async connection pool opened by open_async_pool()."""
+    global _ASYNC_POOL
+    if _ASYNC_POOL is not None:
+        await _ASYNC_POOL.close()
+        _ASYNC_POOL = None
+
+def get_db_connection():
+    """Borrow a connection to the PostgreSQL database from the pool."""
+    return _get_pool().getconn()
+
+def release_db_connection(conn):
+    """Return a connection borrowed with get_db_connection() to the pool."""
+    # End read-only transactions left open by queries; the pool itself
+    # discards broken connections and replaces them
+    try:
+        if conn.info.transaction_status == TransactionStatus.INTRANS:
+            conn.rollback()
+    except psycopg.Error as e:
+        logger.warning(f"Error rolling back returned connection: {e}")
+    finally:
+        _get_pool().putconn(conn)
+
 def init_db():
     """Initialize the database by creating the votes table if it doesn't exist."""
     logger.info("Initializing database...")
@@ -51,31 +244,57 @@ def init_db():
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
+        # IF NOT EXISTS doesn't protect concurrent DDL from duplicate catalog
+        # entries, so workers run the schema setup one at a time
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (_INIT_DB_LOCK_KEY,))
         logger.info("Creating votes table if it doesn't exist...")
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS votes (
                 id SERIAL PRIMARY KEY,
                 user_query TEXT,
                 bot_response TEXT,
-                evaluation_json TEXT,
+                evaluation_json JSONB,
                 vote TEXT CHECK(vote IN ('yes', 'no')),
                 comment TEXT,
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # Tables created before evaluation_json was JSONB store it as TEXT.
+        # Values JSONB rejects (invalid JSON, NaN/Infinity, \u0000 escapes) are
+        # wrapped as {"raw_text": ...}, as _to_jsonb() does for new votes, so
+        # the conversion can't fail.
+        cursor.execute("""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = current_schema() AND table_name = 'votes'
+                        AND column_name = 'evaluation_json' AND data_type = 'text'
+                ) THEN
+                    CREATE FUNCTION pg_temp.votes_evaluation_to_jsonb(value TEXT) RETURNS JSONB
+                    LANGUAGE plpgsql IMMUTABLE AS $fn$
+                    BEGIN
+                        RETURN value::jsonb;
+                    EXCEPTION WHEN invalid_text_representation OR untranslatable_character THEN
+                        RETURN jsonb_build_object('raw_text', value);
+                    END
+                    $fn$;
+                    EXECUTE 'ALTER TABLE votes ALTER COLUMN evaluation_json TYPE JSONB
+                                 USING pg_temp.votes_evaluation_to_jsonb(evaluation_json)';
+                    DROP FUNCTION pg_temp.votes_evaluation_to_jsonb(TEXT);
+                END IF;
+            END
+            $$
+        """)
+        logger.info("Creating votes indexes if they don't exist...")
+        # Newest-first listing, optionally filtered by vote type
+        cursor.execute("CREATE INDEX IF NOT EXISTS votes_ts_desc_idx ON votes (timestamp DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS votes_vote_ts_idx ON votes (vote, timestamp DESC)")
+        # Commented votes counted by the statistics dashboard
+        cursor.execute("CREATE INDEX IF NOT EXISTS votes_comment_idx ON votes (id) WHERE comment <> ''")
         conn.commit()
+        cursor.close()
         logger.info("Database initialized successfully")
-        
-        # Verify the table exists
-        cursor.execute("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'votes')")
-        table_exists = cursor.fetchone()[0]
-        logger.info(f"Votes table exists: {table_exists}")
-        
-        if table_exists:
-            # Count rows in the table
-            cursor.execute("SELECT COUNT(*) FROM votes")
-            row_count = cursor.fetchone()[0]
-            logger.info(f"Votes table contains {row_count} rows")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         # Print to stdout for Heroku logs
@@ -85,11 +304,41 @@ def init_db():
         raise
     finally:
         if conn:
-            conn.close()
+            release_db_connection(conn)
+
+def _reject_json_constant(name):
+    """json.loads() parse_constant hook: JSONB has no NaN or Infinity."""
+    raise ValueError(f"JSONB does not support {name}")
+
+def _to_jsonb(evaluation_json):
+    """
+    Adapt an evaluation, given as JSON text or an already decoded object, for the JSONB column.
+
+    Values JSONB can't hold (invalid JSON, NaN/Infinity, strings with NUL
+    characters) are kept as {"raw_text": ...}, like the init_db() migration does.
+    """
+    if evaluation_json is None:
+        return None
+    text = evaluation_json if isinstance(evaluation_json, str) else None
+    try:
+        if text is not None:
+            value = json.loads(text, parse_constant=_reject_json_constant)
+        else:
+            value = evaluation_json
+        if "\\u0000" in json.dumps(value, allow_nan=False):
+            raise ValueError("JSONB strings cannot contain NUL characters")
+    except ValueError:
+        if text is None:
+            text = json.dumps(evaluation_json)
+        # Keep free-text evaluations, in the same shape the chat endpoint uses;
+        # Postgres text can't hold NUL characters at all
+        value = {"raw_text": text.replace("\x00", "")}
+    return Jsonb(value)
 
 def record_vote(user_query, bot_response, evaluation_json, vote, comment=""):
     """Record a vote in the database."""
-    logger.info(f"Attempting to record vote: {vote}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Attempting to record vote: {vote}")
     if vote not in ["yes", "no"]:
         logger.error(f"Invalid vote value: {vote}")
         raise ValueError("Vote must be 'yes' or 'no'")
@@ -101,20 +350,19 @@ def record_vote(user_query, bot_response, evaluation_json, vote, comment=""):
 
     conn = None
     try:
-        logger.info("Getting database connection...")
+        logger.debug("Getting database connection...")
         conn = get_db_connection()
         cursor = conn.cursor()
-        logger.info("Executing INSERT query...")
-        cursor.execute(sql, (user_query, bot_response, evaluation_json, vote, comment))
-        conn.commit()
-        logger.info(f"Vote recorded successfully: {vote}")
-        
-        # Verify the insertion
-        cursor.execute("SELECT COUNT(*) FROM votes WHERE vote = %s", (vote,))
-        count = cursor.fetchone()[0]
-        logger.info(f"Total votes with value '{vote}': {count}")
-        
+        logger.debug("Executing INSERT query...")
+        # Send the INSERT and COMMIT together instead of waiting on each reply
+        with conn.pipeline():
+            cursor.execute(_WRITE_SETTINGS_SQL)
+            cursor.execute(sql, (user_query, bot_response, _to_jsonb(evaluation_json), vote, comment))
+            conn.commit()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Vote recorded successfully: {vote} ({cursor.rowcount} row)")
         cursor.close()
+        invalidate_statistics_cache()
     except Exception as e:
         logger.error(f"Error recording vote: {e}")
         # Print to stdout for Heroku logs
@@ -124,133 +372,369 @@ def record_vote(user_query, bot_response, evaluation_json, vote, comment=""):
         raise
     finally:
         if conn:
-            conn.close()
+            release_db_connection(conn)
     
-def fetch_votes(limit=None, offset=0, vote_filter=None, start_date=None, end_date=None):
+def record_votes_bulk(rows):
+    """
+    Record several votes in a single batched INSERT.
+
+    Args:
+        rows: Iterable of (user_query, bot_response, evaluation_json, vote, comment) tuples
+
+    Returns:
+        Number of votes recorded
+    """
+    rows = [
+        (user_query, bot_response, _to_jsonb(evaluation_json), vote, comment)
+        for user_query, bot_response, evaluation_json, vote, comment in rows
+    ]
+    for row in rows:
+        if row[3] not in ["yes", "no"]:
+            logger.error(f"Invalid vote value: {row[3]}")
+            raise ValueError("Vote must be 'yes' or 'no'")
+    if not rows:
+        return 0
+
+    sql = """
+        INSERT INTO votes (user_query, bot_response, evaluation_json, vote, comment)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        # Pipeline every INSERT and the COMMIT into a single round trip
+        with conn.pipeline():
+            cursor.execute(_WRITE_SETTINGS_SQL)
+            cursor.executemany(sql, rows)
+            conn.commit()
+        cursor.close()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Recorded {len(rows)} votes in bulk")
+        invalidate_statistics_cache()
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error recording votes in bulk: {e}")
+        # Print to stdout for Heroku logs
+        print(f"DATABASE RECORD ERROR: {str(e)}")
+        if conn:
+            conn.rollback()
+        raise
+    finally:
+        if conn:
+            release_db_connection(conn)
+
+@functools.lru_cache(maxsize=2)
+def _fetch_votes_sql(include_evaluation):
+    """
+    Return the fetch_votes() SELECT for the given column set.
+
+    Every filter is always present and disabled by binding NULL, so the statement
+    text only varies with the column list and the server can reuse its prepared plan.
+    """
+    # evaluation_json is stored out of line (TOAST), so leaving it out keeps row reads narrow
+    if include_evaluation:
+        columns = "id, user_query, bot_response, evaluation_json, vote, comment, timestamp"
+    else:
+        columns = "id, user_query, bot_response, vote, comment, timestamp"
+    return f"""
+        SELECT {columns} FROM votes
+        WHERE (%(vote)s::text IS NULL OR vote = %(vote)s::text)
+            AND (%(start)s::date IS NULL OR timestamp >= %(start)s::date)
+            -- Compare against the start of the next day so the timestamp index is usable
+            AND (%(end)s::date IS NULL OR timestamp < %(end)s::date + 1)
+        ORDER BY timestamp DESC
+        LIMIT %(limit)s OFFSET %(offset)s
+    """
+
+def _parse_date(value, label):
+    """Parse a 'YYYY-MM-DD' filter into a date; dates and None pass through."""
+    if not value or isinstance(value, date):
+        return value or None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{label} must be in YYYY-MM-DD format") from None
+
+def _build_fetch_votes_query(limit, offset, vote_filter, start_date, end_date, include_evaluation):
+    """
+    Return the SQL and parameters for fetch_votes(), fetch_votes_async() and iter_votes().
+
+    Raises:
+        ValueError: If start_date or end_date is not a valid 'YYYY-MM-DD' date
+    """
+    # Dates are bound as date parameters, so the server doesn't re-parse strings
+    start_date = _parse_date(start_date, "start_date")
+    end_date = _parse_date(end_date, "end_date")
+
+    # A NULL limit returns all rows
+    params = {
+        "vote": vote_filter or None,
+        "start": start_date,
+        "end": end_date,
+        "limit": limit,
+        "offset": offset,
+    }
+    return _fetch_votes_sql(include_evaluation), params
+
+def fetch_votes(limit=None, offset=0, vote_filter=None, start_date=None, end_date=None, include_evaluation=False):
     """
     Fetch votes with optional filtering and pagination
 
     Args:
-        limit: Maximum number of votes to return (None for all)
+        limit: Maximum number of votes to return (DEFAULT_FETCH_LIMIT if None, capped at MAX_FETCH_LIMIT)
         offset: Number of votes to skip
         vote_filter: Filter by vote type ('yes' or 'no')
         start_date: Filter votes from this date (inclusive, format 'YYYY-MM-DD')
         end_date: Filter votes up to this date (inclusive, format 'YYYY-MM-DD')
+        include_evaluation: Whether to include the evaluation_json column
 
     Returns:
         List of dictionaries containing vote data
+
+    Raises:
+        ValueError: If start_date or end_date is not a valid 'YYYY-MM-DD' date
     """
+    limit = min(limit or DEFAULT_FETCH_LIMIT, MAX_FETCH_LIMIT)
+    query, params = _build_fetch_votes_query(limit, offset, vote_filter, start_date, end_date, include_evaluation)
+
     conn = None
     try:
         conn = get_db_connection()
-        # Use DictCursor to return rows as dictionaries
-        cursor = conn.cursor(cursor_factory=DictCursor)
-
-        query = "SELECT id, user_query, bot_response, evaluation_json, vote, comment, timestamp FROM votes"
-        conditions = []
-        params = []
-
-        if vote_filter:
-            conditions.append("vote = %s")
-            params.append(vote_filter)
-
-        if start_date:
-            try:
-                datetime.strptime(start_date, "%Y-%m-%d")
-                conditions.append("DATE(timestamp) >= %s")
-                params.append(start_date)
-            except Exception as e:
-                logger.error(f"Invalid start_date format: {start_date} - {e}")
-
-        if end_date:
-            try:
-                datetime.strptime(end_date, "%Y-%m-%d")
-                conditions.append("DATE(timestamp) <= %s")
-                params.append(end_date)
-            except Exception as e:
-                logger.error(f"Invalid end_date format: {end_date} - {e}")
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        query += " ORDER BY timestamp DESC"
-
-        if limit is not None:
-            query += " LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
-
-        cursor.execute(query, params)
-        rows = [dict(row) for row in cursor.fetchall()]
-        logger.info(f"Fetched {len(rows)} votes")
+        # Use dict_row to return rows as dictionaries
+        cursor = conn.cursor(row_factory=dict_row)
+        # Send the settings, query and end of transaction in one round trip
+        with conn.pipeline():
+            conn.execute(_READ_SETTINGS_SQL, (STATEMENT_TIMEOUT,))
+            cursor.execute(query, params)
+            conn.commit()
+        rows = cursor.fetchall()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fetched {len(rows)} votes")
         return rows
     except Exception as e:
         logger.error(f"Error executing fetch_votes query: {e}")
         return []
     finally:
         if conn:
-            conn.close()
+            release_db_connection(conn)
+
+async def fetch_votes_async(limit=None, offset=0, vote_filter=None, start_date=None, end_date=None, include_evaluation=False):
+    """
+    Async variant of fetch_votes() running on the pool from open_async_pool().
+
+    Takes the same arguments and returns the same list of dictionaries, or an
+    empty list if the query fails.
+
+    Raises:
+        RuntimeError: If open_async_pool() hasn't been called
+        ValueError: If start_date or end_date is not a valid 'YYYY-MM-DD' date
+    """
+    limit = min(limit or DEFAULT_FETCH_LIMIT, MAX_FETCH_LIMIT)
+    query, params = _build_fetch_votes_query(limit, offset, vote_filter, start_date, end_date, include_evaluation)
+
+    pool = _get_async_pool()
+    try:
+        async with pool.connection() as conn:
+            cursor = conn.cursor(row_factory=dict_row)
+            # Send the settings, query and end of transaction in one round trip
+            async with conn.pipeline():
+                await conn.execute(_READ_SETTINGS_SQL, (STATEMENT_TIMEOUT,))
+                await cursor.execute(query, params)
+                await conn.commit()
+            rows = await cursor.fetchall()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Fetched {len(rows)} votes")
+            return rows
+    except Exception as e:
+        logger.error(f"Error executing fetch_votes query: {e}")
+        return []
+
+def iter_votes(vote_filter=None, start_date=None, end_date=None, include_evaluation=False, itersize=1000):
+    """
+    Stream every vote matching the filters, newest first, without buffering the whole result
+
+    Args:
+        vote_filter: Filter by vote type ('yes' or 'no')
+        start_date: Filter votes from this date (inclusive, format 'YYYY-MM-DD')
+        end_date: Filter votes up to this date (inclusive, format 'YYYY-MM-DD')
+        include_evaluation: Whether to include the evaluation_json column
+        itersize: Number of rows fetched from the server per round trip
+
+    Returns:
+        Iterator of dictionaries containing vote data
+
+    Raises:
+        ValueError: If start_date or end_date is not a valid 'YYYY-MM-DD' date,
+            when called rather than when iteration starts
+    """
+    query, params = _build_fetch_votes_query(None, 0, vote_filter, start_date, end_date, include_evaluation)
+    return _iter_votes(query, params, itersize)
+
+def _iter_votes(query, params, itersize):
+    """Yield the rows of a fetch_votes query through a server-side cursor."""
+    conn = get_db_connection()
+    try:
+        # Server-side cursor, scoped to this transaction, so rows arrive in chunks
+        with conn.cursor(name="votes_export", row_factory=dict_row) as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            yield from cursor
+    finally:
+        release_db_connection(conn)
+
+# Total, yes, no and commented vote counts, the yes/no percentages and the
+# votes per day (last 30 days) as a {"YYYY-MM-DD": count} JSONB object, all
+# from one snapshot in one round trip
+_VOTE_STATISTICS_SQL = """
+    WITH summary AS (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE vote = 'yes') AS yes,
+            COUNT(*) FILTER (WHERE vote = 'no') AS no,
+            COUNT(*) FILTER (WHERE comment <> '') AS with_comments
+        FROM votes
+    ), daily AS (
+        SELECT DATE(timestamp) AS date, COUNT(*) AS count
+        FROM votes
+        WHERE timestamp >= CURRENT_DATE - INTERVAL '30 days'
+        GROUP BY DATE(timestamp)
+    )
+    SELECT
+        summary.total,
+        summary.yes,
+        summary.no,
+        COALESCE(ROUND(100.0 * summary.yes / NULLIF(summary.total, 0), 2), 0)::float8 AS yes_pct,
+        COALESCE(ROUND(100.0 * summary.no / NULLIF(summary.total, 0), 2), 0)::float8 AS no_pct,
+        summary.with_comments,
+        (SELECT COALESCE(jsonb_object_agg(date::text, count), '{}'::jsonb) FROM daily) AS per_day
+    FROM summary
+"""
+
+_EMPTY_STATISTICS = {
+    "total_votes": 0,
+    "yes_votes": 0,
+    "no_votes": 0,
+    "yes_percentage": 0,
+    "no_percentage": 0,
+    "votes_with_comments": 0,
+    "votes_per_day": {}
+}
+
+def _build_vote_statistics(row):
+    """Shape the statistics query result into the response dictionary."""
+    # psycopg decodes the JSONB per-day column straight into a dict
+    total_votes, yes_votes, no_votes, yes_percentage, no_percentage, votes_with_comments, votes_per_day = row
+    return {
+        "total_votes": total_votes,
+        "yes_votes": yes_votes,
+        "no_votes": no_votes,
+        "yes_percentage": yes_percentage,
+        "no_percentage": no_percentage,
+        "votes_with_comments": votes_with_comments,
+        "votes_per_day": votes_per_day
+    }
+
+# Last statistics result and the monotonic time it expires at. The generation
+# is bumped on every invalidation, so a query that started before a vote was
+# recorded can't store its outdated result afterwards.
+_STATS_CACHE = {"value": None, "expires_at": 0.0, "generation": 0}
+_STATS_CACHE_LOCK = threading.Lock()
+
+def _copy_statistics(statistics):
+    """Copy a statistics dictionary so callers can't modify the cached one."""
+    return dict(statistics, votes_per_day=dict(statistics["votes_per_day"]))
+
+def _get_cached_statistics():
+    """
+    Return the cached statistics (None if missing or expired) and the current
+    cache generation, to pass to _set_cached_statistics() after querying.
+    """
+    with _STATS_CACHE_LOCK:
+        generation = _STATS_CACHE["generation"]
+        if _STATS_CACHE["value"] is not None and time.monotonic() < _STATS_CACHE["expires_at"]:
+            return _copy_statistics(_STATS_CACHE["value"]), generation
+    return None, generation
+
+def _set_cached_statistics(statistics, generation):
+    """Cache a statistics result for STATS_CACHE_TTL seconds, unless invalidated since generation."""
+    with _STATS_CACHE_LOCK:
+        if _STATS_CACHE["generation"] != generation:
+            return
+        _STATS_CACHE["value"] = _copy_statistics(statistics)
+        _STATS_CACHE["expires_at"] = time.monotonic() + STATS_CACHE_TTL
+
+def invalidate_statistics_cache():
+    """Drop the cached statistics so the next call reads fresh counts."""
+    with _STATS_CACHE_LOCK:
+        _STATS_CACHE["value"] = None
+        _STATS_CACHE["generation"] += 1
 
 def get_vote_statistics():
     """
     Get statistics about the votes
+
+    Results are cached in memory for STATS_CACHE_TTL seconds, or until a new
+    vote is recorded by this process.
     
     Returns:
         Dictionary containing vote statistics
     """
+    statistics, cache_generation = _get_cached_statistics()
+    if statistics is not None:
+        return statistics
+
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Get total votes
-        cursor.execute("SELECT COUNT(*) FROM votes")
-        total_votes = cursor.fetchone()[0]
-        
-        # Get yes votes
-        cursor.execute("SELECT COUNT(*) FROM votes WHERE vote = 'yes'")
-        yes_votes = cursor.fetchone()[0]
-        
-        # Get no votes
-        cursor.execute("SELECT COUNT(*) FROM votes WHERE vote = 'no'")
-        no_votes = cursor.fetchone()[0]
-        
-        # Get votes with comments
-        cursor.execute("SELECT COUNT(*) FROM votes WHERE comment != ''")
-        votes_with_comments = cursor.fetchone()[0]
-        
-        # Get votes per day (last 30 days)
-        # PostgreSQL syntax for date operations
-        cursor.execute("""
-            SELECT DATE(timestamp) as date, COUNT(*) as count 
-            FROM votes 
-            WHERE timestamp >= CURRENT_DATE - INTERVAL '30 days' 
-            GROUP BY DATE(timestamp) 
-            ORDER BY date
-        """)
-        votes_per_day = {str(row[0]): row[1] for row in cursor.fetchall()}
-        
-        logger.info("Vote statistics retrieved successfully")
+        # Send the settings, query and end of transaction in one round trip
+        with conn.pipeline():
+            conn.execute(_READ_SETTINGS_SQL, (STATEMENT_TIMEOUT,))
+            cursor.execute(_VOTE_STATISTICS_SQL)
+            conn.commit()
+        statistics = _build_vote_statistics(cursor.fetchone())
         
-        return {
-            "total_votes": total_votes,
-            "yes_votes": yes_votes,
-            "no_votes": no_votes,
-            "yes_percentage": (yes_votes / total_votes * 100) if total_votes > 0 else 0,
-            "no_percentage": (no_votes / total_votes * 100) if total_votes > 0 else 0,
-            "votes_with_comments": votes_with_comments,
-            "votes_per_day": votes_per_day
-        }
+        logger.debug("Vote statistics retrieved successfully")
+        _set_cached_statistics(statistics, cache_generation)
+        return statistics
     except Exception as e:
         logger.error(f"Error retrieving vote statistics: {e}")
-        return {
-            "total_votes": 0,
-            "yes_votes": 0,
-            "no_votes": 0,
-            "yes_percentage": 0,
-            "no_percentage": 0,
-            "votes_with_comments": 0,
-            "votes_per_day": {}
-        }
+        return dict(_EMPTY_STATISTICS, votes_per_day={})
     finally:
         if conn:
-            conn.close()
+            release_db_connection(conn)
+
+async def get_vote_statistics_async():
+    """
+    Async variant of get_vote_statistics() running on the pool from open_async_pool().
+
+    Returns:
+        Dictionary containing vote statistics, all zero if the query fails
+
+    Raises:
+        RuntimeError: If open_async_pool() hasn't been called
+    """
+    statistics, cache_generation = _get_cached_statistics()
+    if statistics is not None:
+        return statistics
+
+    pool = _get_async_pool()
+    try:
+        async with pool.connection() as conn:
+            cursor = conn.cursor()
+            # Send the settings, query and end of transaction in one round trip
+            async with conn.pipeline():
+                await conn.execute(_READ_SETTINGS_SQL, (STATEMENT_TIMEOUT,))
+                await cursor.execute(_VOTE_STATISTICS_SQL)
+                await conn.commit()
+            statistics = _build_vote_statistics(await cursor.fetchone())
+
+            logger.debug("Vote statistics retrieved successfully")
+            _set_cached_statistics(statistics, cache_generation)
+            return statistics
+    except Exception as e:
+        logger.error(f"Error retrieving vote statistics: {e}")
+        return dict(_EMPTY_STATISTICS, votes_per_day={})